@@ -1,14 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from app.services.chat_search import ChatSearchService
+from app.services.chat_router import RoutingConfig, get_routing_config
 from app.services.trip_details import TripDetailsService
 from app.services.flight_bookings import FlightPriceService
 from app.services.pdf_generator import PDFGenerator
+from app.services.llm import get_hedge_metrics
 from app.models.schemas import (
     ChatRequest,
     ChatResponse,
     TripDetailsRequest,
     TripDetailsResponse,
+    TripUpdateRequest,
     FlightPriceRequest,
 )
 import logging
@@ -18,8 +21,17 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def get_chat_search_service(
+    routing_config: RoutingConfig = Depends(get_routing_config),
+) -> ChatSearchService:
+    """Dependency providing the chat search service with its routing config"""
+    return ChatSearchService(routing_config)
+
+
 @router.post("/chat", response_model=ChatResponse)
-async def chat_search(request: ChatRequest, service: ChatSearchService = Depends()):
+async def chat_search(
+    request: ChatRequest, service: ChatSearchService = Depends(get_chat_search_service)
+):
     """Endpoint for chat search"""
     logger.info(f"Received query: {request.query}")
     response = await service.process_query(request.query, request.token)
@@ -44,6 +56,30 @@ async def process_trip_details(
         )
 
 
+@router.post("/trip-details/update", response_model=TripDetailsResponse)
+async def update_trip_details(
+    request: TripUpdateRequest, service: TripDetailsService = Depends()
+):
+    """Endpoint for regenerating selected parts of an existing itinerary"""
+    logger.info(
+        f"Received trip update input: days={request.days}, sections={request.sections}"
+    )
+    try:
+        details = await service.update_trip_details(
+            request.query, request.itinerary, request.days, request.sections
+        )
+        if "error" in details:
+            raise HTTPException(status_code=400, detail=details["error"])
+        return TripDetailsResponse(itinerary=details["itinerary"], token=request.token)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Error updating trip details: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+
 @router.post("/flights/prices")
 async def get_flight_prices(
     request: FlightPriceRequest, service: FlightPriceService = Depends()
@@ -95,14 +131,25 @@ async def download_trip_details(
             raise HTTPException(status_code=400, detail=trip_details["error"])
 
         pdf_buffer = pdf_service.generate_pdf(trip_details["itinerary"])
+        pdf_size = pdf_buffer.seek(0, 2)
+        pdf_buffer.seek(0)
 
         return StreamingResponse(
-            iter([pdf_buffer.getvalue()]),
+            pdf_service.iter_chunks(pdf_buffer),
             media_type="application/pdf",
-            headers={"Content-Disposition": "attachment; filename=trip_itinerary.pdf"},
+            headers={
+                "Content-Disposition": "attachment; filename=trip_itinerary.pdf",
+                "Content-Length": str(pdf_size),
+            },
         )
     except Exception as e:
         logger.error(f"Error generating PDF: {str(e)}")
         raise HTTPException(
             status_code=500, detail=f"An unexpected error occurred: {str(e)}"
         )
+
+
+@router.get("/llm/metrics")
+async def get_llm_metrics():
+    """Endpoint for LLM hedging metrics per endpoint"""
+    return {"metrics": get_hedge_metrics()}
@@ -29,3 +29,24 @@ Itinerary Summary:
 
 Provide your response as a JSON array of strings, each representing an attraction or landmark.
 """
+
+ITINERARY_UPDATE_PROMPT = """
+As an AI travel planner, update part of an existing itinerary based on the following information:
+
+Dates: {dates}
+Location: {location}
+Budget: {budget}
+Travelers: {travelers}
+Activities: {activities}
+Meal Preferences: {meal_preferences}
+
+Current Itinerary:
+{itinerary}
+
+Only regenerate the following parts of the itinerary: {targets}
+Keep them consistent with the rest of the current itinerary.
+
+Format the response as a complete and valid JSON object containing only the keys being regenerated.
+If "daily_itinerary" is included, it must be an array containing only the requested days, each object with "day", "activities", "meals", and "transportation" keys.
+"accommodations" and "tips" should be arrays of strings.
+"""
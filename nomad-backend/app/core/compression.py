@@ -0,0 +1,83 @@
+import gzip
+import logging
+from typing import Optional
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, fall back to gzip only
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the best supported encoding from an Accept-Encoding header"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    supported = ["br", "gzip"] if brotli is not None else ["gzip"]
+    for encoding in supported:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a response body with the given encoding"""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL)
+
+
+class CompressionMiddleware(BaseHTTPMiddleware):
+    """Middleware that compresses JSON responses above a size threshold
+    using brotli or gzip, depending on what the client accepts.
+    """
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        response = await call_next(request)
+
+        content_type = response.headers.get("content-type", "")
+        if (
+            not content_type.startswith("application/json")
+            or "content-encoding" in response.headers
+        ):
+            return response
+
+        response.headers.add_vary_header("Accept-Encoding")
+        encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+        if encoding is None:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        headers = {
+            key: value
+            for key, value in response.headers.items()
+            if key != "content-length"
+        }
+
+        if len(body) >= settings.COMPRESSION_MINIMUM_SIZE:
+            compressed = compress(body, encoding)
+            logger.debug(
+                f"Compressed response with {encoding}: {len(body)} -> {len(compressed)} bytes"
+            )
+            body = compressed
+            headers["content-encoding"] = encoding
+
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=headers,
+            background=response.background,
+        )
@@ -12,6 +12,65 @@ class Settings(BaseSettings):
     UNSPLASH_SECRET_KEY: str
     FLIGHT_API_KEY: str
     FLIGHT_API_URL: str = "https://test.api.amadeus.com/v2/shopping/flight-offers"
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    PDF_CHUNK_SIZE: int = 64 * 1024
+    LLM_DEFAULT_TIMEOUT: float = 60.0
+    LLM_TIMEOUTS: dict[str, float] = {
+        "chat:fast": 15.0,
+        "chat:complex": 30.0,
+        "trip_details": 60.0,
+        "trip_details:images": 15.0,
+    }
+    LLM_FALLBACK_MODELS: dict[str, str] = {
+        "chat:fast": "gemini-1.5-flash-8b",
+        "chat:complex": "gemini-1.5-flash",
+        "trip_details": "gemini-1.5-flash-8b",
+        "trip_details:images": "gemini-1.5-flash-8b",
+    }
+    LLM_HEDGE_PERCENTILE: float = 0.95
+    LLM_HEDGE_MIN_SAMPLES: int = 20
+    LLM_HEDGE_DEFAULT_DELAY: float = 10.0
+    LLM_HEDGE_DELAYS: dict[str, float] = {
+        "chat:fast": 3.0,
+        "chat:complex": 8.0,
+        "trip_details": 15.0,
+        "trip_details:images": 3.0,
+    }
+    LLM_HEDGE_MAX_DELAY_FRACTION: float = 0.5
+    LLM_LATENCY_WINDOW: int = 200
+    CHAT_FAST_MODEL: str = "gemini-1.5-flash"
+    CHAT_COMPLEX_MODEL: str = "gemini-1.5-pro"
+    CHAT_ROUTING_THRESHOLD: float = 0.5
+    CHAT_COMPLEX_KEYWORDS: list[str] = [
+        "plan",
+        "itinerary",
+        "schedule",
+        "compare",
+        "recommend",
+        "budget",
+        "days",
+        "day trip",
+        "week",
+        "route",
+        "visa",
+        "best way",
+        "things to do",
+    ]
+    CHAT_SIMPLE_KEYWORDS: list[str] = [
+        "thanks",
+        "thank you",
+        "ok",
+        "hello",
+        "hi",
+        "bye",
+        "currency",
+        "time zone",
+        "weather",
+        "language",
+    ]
+    CHAT_ROUTING_WEIGHTS: dict[str, float] = {}
 
     class Config:
         env_file = ".env"
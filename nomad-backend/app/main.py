@@ -2,6 +2,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
 from app.core.logging import setup_logging
 
@@ -16,6 +17,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON responses
+app.add_middleware(CompressionMiddleware)
+
 # Set up logging
 setup_logging()
 
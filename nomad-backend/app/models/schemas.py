@@ -34,6 +34,16 @@ class TripDetailsResponse(BaseModel):
     token: Optional[str] = None
 
 
+class TripUpdateRequest(BaseModel):
+    """Schema for partial trip itinerary update request"""
+
+    query: Dict[str, Any]
+    itinerary: Dict[str, Any]
+    days: Optional[List[int]] = None
+    sections: Optional[List[str]] = None
+    token: Optional[str] = None
+
+
 class FlightPriceRequest(BaseModel):
     """Schema for flight price request"""
 
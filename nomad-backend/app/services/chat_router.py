@@ -0,0 +1,109 @@
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
+from app.core.config import settings
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Word endings accepted after a complex keyword, e.g. "week" -> "weeks", "plan" -> "planning".
+# Keywords ending in "e" drop it first, e.g. "schedule" -> "scheduled", "compare" -> "comparing"
+KEYWORD_SUFFIXES = r"(?:s|es|ed|ing|ning|ned|ation|ations)?"
+E_KEYWORD_SUFFIXES = r"(?:e|es|ed|er|ers|ing|ation|ations)"
+
+
+class RoutingConfig(BaseModel):
+    """Schema for chat routing configuration"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    fast_model: str = "gemini-1.5-flash"
+    complex_model: str = "gemini-1.5-pro"
+    threshold: float = 0.5
+    complex_keywords: List[str] = []
+    simple_keywords: List[str] = []
+    long_query_words: int = 40
+    deep_history_turns: int = 6
+    length_weight: float = 0.3
+    history_weight: float = 0.1
+    keyword_weight: float = 0.5
+    question_weight: float = 0.1
+    simple_penalty: float = 0.3
+
+
+def get_routing_config() -> RoutingConfig:
+    """Build the routing configuration from settings"""
+    return RoutingConfig(
+        **{
+            "fast_model": settings.CHAT_FAST_MODEL,
+            "complex_model": settings.CHAT_COMPLEX_MODEL,
+            "threshold": settings.CHAT_ROUTING_THRESHOLD,
+            "complex_keywords": settings.CHAT_COMPLEX_KEYWORDS,
+            "simple_keywords": settings.CHAT_SIMPLE_KEYWORDS,
+            **settings.CHAT_ROUTING_WEIGHTS,
+        }
+    )
+
+
+class ChatRouter:
+    """Routes chat queries to a fast or a complex model based on a local
+    complexity score built from query length, history depth and keywords.
+    """
+
+    def __init__(self, config: Optional[RoutingConfig] = None):
+        self.config = config or get_routing_config()
+
+    def features(self, query: str, chat_history: List[Dict[str, str]]) -> Dict[str, Any]:
+        words = re.findall(r"[\w']+", query.lower())
+        text = " ".join(words)
+        return {
+            "words": len(words),
+            "turns": len(chat_history) // 2,
+            "complex_hits": self._count_keywords(
+                text, self.config.complex_keywords, inflect=True
+            ),
+            "simple_hits": self._count_keywords(text, self.config.simple_keywords),
+            "questions": query.count("?"),
+        }
+
+    @staticmethod
+    def _keyword_pattern(keyword: str, inflect: bool = False) -> str:
+        if not inflect:
+            return rf"\b{re.escape(keyword)}\b"
+        if keyword.endswith("e"):
+            return rf"\b{re.escape(keyword[:-1])}{E_KEYWORD_SUFFIXES}\b"
+        return rf"\b{re.escape(keyword)}{KEYWORD_SUFFIXES}\b"
+
+    @classmethod
+    def _count_keywords(cls, text: str, keywords: List[str], inflect: bool = False) -> int:
+        return sum(
+            1
+            for keyword in keywords
+            if re.search(cls._keyword_pattern(keyword, inflect), text)
+        )
+
+    def score(self, features: Dict[str, Any]) -> float:
+        config = self.config
+        score = (
+            config.length_weight * min(features["words"] / config.long_query_words, 1)
+            + config.history_weight
+            * min(features["turns"] / config.deep_history_turns, 1)
+            + config.keyword_weight * min(features["complex_hits"], 1)
+            + config.question_weight * min(max(features["questions"] - 1, 0), 1)
+        )
+        if features["simple_hits"] and not features["complex_hits"]:
+            score -= config.simple_penalty
+        return max(0.0, min(score, 1.0))
+
+    def route(self, query: str, chat_history: List[Dict[str, str]]) -> Tuple[str, str]:
+        """Return the route tier ("fast" or "complex") and model for the query"""
+        features = self.features(query, chat_history)
+        score = self.score(features)
+        if score >= self.config.threshold:
+            tier, model = "complex", self.config.complex_model
+        else:
+            tier, model = "fast", self.config.fast_model
+        logger.info(
+            f"Routed chat query to {tier} model {model} (score={score:.2f}, features={features})"
+        )
+        return tier, model
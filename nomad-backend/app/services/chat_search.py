@@ -1,6 +1,8 @@
-import google.generativeai as genai
 from app.core.config import settings
 from app.models.schemas import ChatResponse
+from app.services.chat_router import ChatRouter, RoutingConfig
+from typing import Optional
+from app.services.llm import HedgedModel
 import logging
 import jwt
 
@@ -12,9 +14,9 @@ class ChatSearchService:
     The service processes user queries and generates responses using the Generative AI model.
     """
 
-    def __init__(self):
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel("gemini-1.5-pro")
+    def __init__(self, routing_config: Optional[RoutingConfig] = None):
+        self.router = ChatRouter(routing_config)
+        self.models = {}
         self.system_prompt = """
         You are an AI-powered travel assistant named Nomad. Your role is to help users plan their trips by providing information, recommendations, and answering their travel-related questions. You
         have access to a vast knowledge base about destinations, accommodations, transportation, activities, and more.
@@ -28,6 +30,16 @@ class ChatSearchService:
         - If the query is not related to travel or is inappropriate, gently guide the user back to the topic of travel planning.
         """
 
+    def _get_model(self, tier: str, model_name: str) -> HedgedModel:
+        if tier not in self.models:
+            self.models[tier] = HedgedModel(f"chat:{tier}", model_name)
+        return self.models[tier]
+
+    @staticmethod
+    def _validate_response(text: str):
+        if not text:
+            raise ValueError("Empty response from model")
+
     async def process_query(self, query: str, token: str = None) -> ChatResponse:
         logger.info(f"Processing query: {query}")
 
@@ -59,8 +71,10 @@ class ChatSearchService:
         Nomad: """
 
         try:
-            response = self.model.generate_content(prompt)
-            response_text = response.text.strip()
+            model = self._get_model(*self.router.route(query, chat_history))
+            response_text = await model.generate_content(
+                prompt, validate=self._validate_response
+            )
 
             chat_history.append({"role": "User", "content": query})
             chat_history.append({"role": "Nomad", "content": response_text})
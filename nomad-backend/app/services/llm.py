@@ -0,0 +1,186 @@
+from typing import Any, Callable, Dict, Optional
+from collections import deque
+import asyncio
+import logging
+import time
+import google.generativeai as genai
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HedgeStats:
+    """Rolling primary-model latencies and hedging counters for one endpoint"""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.model = None
+        self.fallback_model = None
+        self.timeout = settings.LLM_TIMEOUTS.get(endpoint, settings.LLM_DEFAULT_TIMEOUT)
+        self.latencies = deque(maxlen=settings.LLM_LATENCY_WINDOW)
+        self.requests = 0
+        self.hedged_on_latency = 0
+        self.hedge_wins = 0
+        self.retried_on_failure = 0
+        self.retry_wins = 0
+        self.failures = 0
+
+    def record_latency(self, latency: float):
+        self.latencies.append(latency)
+
+    def hedge_delay(self) -> float:
+        """Delay before hedging, taken from the configured latency percentile
+        and capped to a fraction of the timeout so the backup always gets a chance.
+        """
+        if len(self.latencies) < settings.LLM_HEDGE_MIN_SAMPLES:
+            delay = settings.LLM_HEDGE_DELAYS.get(
+                self.endpoint, settings.LLM_HEDGE_DEFAULT_DELAY
+            )
+        else:
+            ordered = sorted(self.latencies)
+            delay = ordered[int(settings.LLM_HEDGE_PERCENTILE * (len(ordered) - 1))]
+        return min(delay, self.timeout * settings.LLM_HEDGE_MAX_DELAY_FRACTION)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "fallback_model": self.fallback_model,
+            "requests": self.requests,
+            "hedged_on_latency": self.hedged_on_latency,
+            "hedge_wins": self.hedge_wins,
+            "retried_on_failure": self.retried_on_failure,
+            "retry_wins": self.retry_wins,
+            "failures": self.failures,
+            "hedge_rate": (
+                self.hedged_on_latency / self.requests if self.requests else 0.0
+            ),
+            "hedge_win_rate": (
+                self.hedge_wins / self.hedged_on_latency
+                if self.hedged_on_latency
+                else 0.0
+            ),
+            "hedge_delay": self.hedge_delay(),
+        }
+
+
+# Stats are shared across service instances, which are created per request
+_stats: Dict[str, HedgeStats] = {}
+
+
+def get_hedge_stats(endpoint: str) -> HedgeStats:
+    if endpoint not in _stats:
+        _stats[endpoint] = HedgeStats(endpoint)
+    return _stats[endpoint]
+
+
+def get_hedge_metrics() -> Dict[str, Dict[str, Any]]:
+    return {endpoint: stats.to_dict() for endpoint, stats in _stats.items()}
+
+
+class HedgedModel:
+    """Gemini model wrapper that hedges slow requests.
+    If the primary model has not answered within the endpoint's hedge delay (or fails),
+    a backup request is sent to the fallback model and the first valid answer wins.
+    """
+
+    def __init__(self, endpoint: str, model_name: str):
+        genai.configure(api_key=settings.GEMINI_API_KEY)
+        self.endpoint = endpoint
+        self.model_name = model_name
+        self.fallback_model_name = settings.LLM_FALLBACK_MODELS.get(
+            endpoint, model_name
+        )
+        self.primary = genai.GenerativeModel(model_name)
+        self.fallback = genai.GenerativeModel(self.fallback_model_name)
+        if self.fallback_model_name == model_name:
+            logger.warning(
+                f"No fallback model configured for {endpoint}, hedging against {model_name} itself"
+            )
+        self.stats = get_hedge_stats(endpoint)
+        self.stats.model = model_name
+        self.stats.fallback_model = self.fallback_model_name
+
+    async def generate_content(
+        self, prompt: str, validate: Optional[Callable[[str], Any]] = None
+    ) -> str:
+        """
+        Generate a response for the prompt within the endpoint's timeout budget.
+        `validate` should raise if a response is unusable, so the other request can win.
+        """
+        self.stats.requests += 1
+        try:
+            return await asyncio.wait_for(
+                self._hedged_call(prompt, validate), self.stats.timeout
+            )
+        except Exception:
+            self.stats.failures += 1
+            raise
+
+    async def _hedged_call(
+        self, prompt: str, validate: Optional[Callable[[str], Any]]
+    ) -> str:
+        primary = asyncio.create_task(
+            self._call(self.primary, prompt, validate, record_latency=True)
+        )
+        backup = None
+        pending = {primary}
+        errors = []
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.stats.hedge_delay())
+            if primary in done and primary.exception() is None:
+                return primary.result()
+
+            retry = primary in done
+            if retry:
+                errors.append(primary.exception())
+                reason = f"primary failed: {primary.exception()}"
+                self.stats.retried_on_failure += 1
+            else:
+                reason = "primary exceeded hedge delay"
+                self.stats.hedged_on_latency += 1
+            logger.info(
+                f"Hedging {self.endpoint} request to {self.fallback_model_name} ({reason})"
+            )
+            backup = asyncio.create_task(self._call(self.fallback, prompt, validate))
+            pending.add(backup)
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup and retry:
+                            self.stats.retry_wins += 1
+                        elif task is backup:
+                            self.stats.hedge_wins += 1
+                        logger.info(
+                            f"{self.endpoint} request won by "
+                            f"{'fallback' if task is backup else 'primary'} model"
+                        )
+                        return task.result()
+                    errors.append(task.exception())
+            raise errors[-1]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _call(
+        self,
+        model: genai.GenerativeModel,
+        prompt: str,
+        validate: Optional[Callable[[str], Any]],
+        record_latency: bool = False,
+    ) -> str:
+        start = time.monotonic()
+        try:
+            response = await model.generate_content_async(prompt)
+            text = response.text.strip()
+            if validate:
+                validate(text)
+            return text
+        finally:
+            # Failed, invalid and cancelled calls are recorded too, so the window
+            # reflects real primary latency rather than only the fast successes
+            if record_latency:
+                self.stats.record_latency(time.monotonic() - start)
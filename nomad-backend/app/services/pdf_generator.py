@@ -12,7 +12,9 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_JUSTIFY
 from io import BytesIO
+from typing import Iterator
 import requests
+from app.core.config import settings
 
 
 class PDFGenerator:
@@ -114,3 +116,14 @@ class PDFGenerator:
         doc.build(Story)
         self.buffer.seek(0)
         return self.buffer
+
+    @staticmethod
+    def iter_chunks(
+        buffer: BytesIO, chunk_size: int = settings.PDF_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Yield the PDF buffer in fixed-size chunks without copying it whole"""
+        try:
+            while chunk := buffer.read(chunk_size):
+                yield chunk
+        finally:
+            buffer.close()
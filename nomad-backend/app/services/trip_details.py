@@ -1,19 +1,25 @@
-from typing import Dict, Any, Union, List
+from typing import Dict, Any, Union, List, Optional
 import json
 import logging
-import google.generativeai as genai
 from app.core.config import settings
 from aiohttp import ClientSession
 import re
-from app.artefacts.prompts import ITINERARY_PROMPT, IMAGE_SEARCH_PROMPT
+from app.services.llm import HedgedModel
+from app.artefacts.prompts import (
+    ITINERARY_PROMPT,
+    ITINERARY_UPDATE_PROMPT,
+    IMAGE_SEARCH_PROMPT,
+)
 
 logger = logging.getLogger(__name__)
 
+ITINERARY_SECTIONS = ["summary", "daily_itinerary", "accommodations", "tips"]
+
 
 class TripDetailsService:
     def __init__(self):
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel("gemini-1.5-flash")
+        self.model = HedgedModel("trip_details", "gemini-1.5-flash")
+        self.image_model = HedgedModel("trip_details:images", "gemini-1.5-flash")
         self.unsplash_access_key = settings.UNSPLASH_ACCESS_KEY
         self.unsplash_secret_key = settings.UNSPLASH_SECRET_KEY
 
@@ -39,25 +45,178 @@ class TripDetailsService:
                 "error": f"An error occurred while processing your trip details: {str(e)}. Please try again."
             }
 
-    async def _generate_itinerary(self, user_input: Dict[str, Any]) -> str:
+    async def update_trip_details(
+        self,
+        user_input: Dict[str, Any],
+        itinerary: Dict[str, Any],
+        days: Optional[List[int]] = None,
+        sections: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
         """
-        Generate a trip itinerary based on user input using the Gemini model.
+        Regenerate only the requested days and sections of an existing itinerary
+        and merge them back, reusing images whose search terms are unchanged.
         """
-        # Create a dictionary with lowercase keys for consistent access
-        input_data = {k.lower(): v for k, v in user_input.items()}
+        logger.info(
+            f"Updating trip details: days={days}, sections={sections}, input={user_input}"
+        )
 
-        prompt = ITINERARY_PROMPT.format(
-            dates=input_data.get("dates", "Not specified"),
-            location=input_data.get("location", "Not specified"),
-            budget=input_data.get("budget", "Not specified"),
-            travelers=input_data.get("travelers", "Not specified"),
-            activities=input_data.get("activities", "Not specified"),
-            meal_preferences=input_data.get("meal preferences", "Not specified"),
+        try:
+            targets = self._resolve_update_targets(days, sections)
+            update = await self._generate_itinerary_update(
+                user_input, itinerary, targets, days
+            )
+            parsed_update = self._parse_itinerary(update)
+            merged_itinerary = self._merge_itinerary(
+                itinerary, parsed_update, targets, days
+            )
+
+            if "summary" in targets:
+                image_search_terms = await self._generate_image_search_terms(
+                    merged_itinerary
+                )
+                merged_itinerary = await self._enrich_with_images(
+                    merged_itinerary,
+                    image_search_terms,
+                    existing_images=itinerary.get("images", []),
+                )
+            return {"itinerary": merged_itinerary}
+        except Exception as e:
+            logger.error(f"Error updating trip details: {str(e)}", exc_info=True)
+            return {
+                "error": f"An error occurred while updating your trip details: {str(e)}. Please try again."
+            }
+
+    @staticmethod
+    def _resolve_update_targets(
+        days: Optional[List[int]], sections: Optional[List[str]]
+    ) -> List[str]:
+        """
+        Work out which itinerary sections need to be regenerated.
+        """
+        targets = list(sections or [])
+        invalid = [section for section in targets if section not in ITINERARY_SECTIONS]
+        if invalid:
+            raise ValueError(f"Unknown itinerary sections: {', '.join(invalid)}")
+        if days and "daily_itinerary" not in targets:
+            targets.append("daily_itinerary")
+        if not targets:
+            raise ValueError("No days or sections were selected for regeneration")
+        return targets
+
+    async def _generate_itinerary_update(
+        self,
+        user_input: Dict[str, Any],
+        itinerary: Dict[str, Any],
+        targets: List[str],
+        days: Optional[List[int]] = None,
+    ) -> str:
+        """
+        Generate the requested parts of an itinerary using the Gemini model.
+        """
+        current_itinerary = {k: v for k, v in itinerary.items() if k != "images"}
+        described_targets = [
+            f"daily_itinerary (days {', '.join(str(day) for day in days)})"
+            if target == "daily_itinerary" and days
+            else target
+            for target in targets
+        ]
+
+        prompt = ITINERARY_UPDATE_PROMPT.format(
+            **self._format_trip_input(user_input),
+            itinerary=json.dumps(current_itinerary, indent=2),
+            targets=", ".join(described_targets),
         )
 
         try:
-            response = self.model.generate_content(prompt)
-            generated_itinerary = response.text.strip()
+            generated_update = await self.model.generate_content(
+                prompt,
+                validate=lambda text: self._check_itinerary_update(
+                    self._parse_itinerary(text), targets, days
+                ),
+            )
+            logger.info(
+                f"Generated itinerary update (first 100 chars): {generated_update[:100]}"
+            )
+            return generated_update
+        except Exception as e:
+            logger.error(f"Error generating itinerary update: {str(e)}")
+            raise
+
+    @staticmethod
+    def _day_number(day: Any) -> Optional[int]:
+        """
+        Normalise a day label such as 2, "2" or "Day 2" to its integer.
+        """
+        match = re.search(r"\d+", str(day))
+        return int(match.group(0)) if match else None
+
+    @classmethod
+    def _check_itinerary_update(
+        cls,
+        update: Dict[str, Any],
+        targets: List[str],
+        days: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Ensure a regenerated update contains every requested section and day.
+        """
+        missing_sections = [target for target in targets if target not in update]
+        if missing_sections:
+            raise ValueError(
+                f"Regenerated itinerary is missing sections: {', '.join(missing_sections)}"
+            )
+        if days:
+            returned_days = {
+                cls._day_number(day.get("day")) for day in update["daily_itinerary"]
+            }
+            missing_days = [str(d) for d in days if int(d) not in returned_days]
+            if missing_days:
+                raise ValueError(
+                    f"Regenerated itinerary is missing days: {', '.join(missing_days)}"
+                )
+
+    @classmethod
+    def _merge_itinerary(
+        cls,
+        itinerary: Dict[str, Any],
+        update: Dict[str, Any],
+        targets: List[str],
+        days: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Merge regenerated sections into a copy of the existing itinerary.
+        """
+        cls._check_itinerary_update(update, targets, days)
+
+        merged = dict(itinerary)
+        for section in targets:
+            if section == "daily_itinerary" and days:
+                requested_days = {int(d) for d in days}
+                updated_days = {
+                    cls._day_number(day.get("day")): day
+                    for day in update["daily_itinerary"]
+                    if cls._day_number(day.get("day")) in requested_days
+                }
+                merged_days = [
+                    updated_days.pop(cls._day_number(day.get("day")), day)
+                    for day in itinerary.get("daily_itinerary", [])
+                ]
+                merged_days.extend(updated_days.values())
+                merged["daily_itinerary"] = merged_days
+            else:
+                merged[section] = update[section]
+        return merged
+
+    async def _generate_itinerary(self, user_input: Dict[str, Any]) -> str:
+        """
+        Generate a trip itinerary based on user input using the Gemini model.
+        """
+        prompt = ITINERARY_PROMPT.format(**self._format_trip_input(user_input))
+
+        try:
+            generated_itinerary = await self.model.generate_content(
+                prompt, validate=self._parse_itinerary
+            )
             logger.info(
                 f"Generated itinerary (first 100 chars): {generated_itinerary[:100]}"
             )
@@ -66,6 +225,23 @@ class TripDetailsService:
             logger.error(f"Error generating itinerary: {str(e)}")
             raise
 
+    @staticmethod
+    def _format_trip_input(user_input: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map user input onto the trip fields used by the itinerary prompts.
+        """
+        # Create a dictionary with lowercase keys for consistent access
+        input_data = {k.lower(): v for k, v in user_input.items()}
+
+        return {
+            "dates": input_data.get("dates", "Not specified"),
+            "location": input_data.get("location", "Not specified"),
+            "budget": input_data.get("budget", "Not specified"),
+            "travelers": input_data.get("travelers", "Not specified"),
+            "activities": input_data.get("activities", "Not specified"),
+            "meal_preferences": input_data.get("meal preferences", "Not specified"),
+        }
+
     def _parse_itinerary(self, itinerary_str: str) -> Dict[str, Any]:
         """
         Parse the generated itinerary string into a structured dictionary.
@@ -118,8 +294,9 @@ class TripDetailsService:
         )
 
         try:
-            response = self.model.generate_content(prompt)
-            raw_response = response.text.strip()
+            raw_response = await self.image_model.generate_content(
+                prompt, validate=self._extract_json_array
+            )
             search_terms = self._extract_json_array(raw_response)
             logger.info(f"Generated image search terms: {search_terms}")
             return search_terms
@@ -139,10 +316,14 @@ class TripDetailsService:
         raise ValueError("No valid JSON array found in the response")
 
     async def _enrich_with_images(
-        self, itinerary: Dict[str, Any], image_search_terms: List[str]
+        self,
+        itinerary: Dict[str, Any],
+        image_search_terms: List[str],
+        existing_images: Optional[List[Dict[str, str]]] = None,
     ) -> Dict[str, Any]:
         """
         Enrich the itinerary with images based on the search terms.
+        Images already fetched for a search term are reused instead of refetched.
         """
         if not image_search_terms:
             logger.warning(
@@ -150,12 +331,28 @@ class TripDetailsService:
             )
             return itinerary
 
-        async with ClientSession() as session:
-            attraction_images = await self._fetch_multiple_images(
-                session, image_search_terms, "attraction"
-            )
-            logger.info(f"Fetched {len(attraction_images)} images for attractions")
-            itinerary["images"] = attraction_images
+        cached_images = {
+            image["search_term"]: image
+            for image in existing_images or []
+            if image.get("search_term")
+        }
+        missing_terms = [term for term in image_search_terms if term not in cached_images]
+        logger.info(
+            f"Reusing {len(image_search_terms) - len(missing_terms)} existing images"
+        )
+
+        if missing_terms:
+            async with ClientSession() as session:
+                attraction_images = await self._fetch_multiple_images(
+                    session, missing_terms, "attraction"
+                )
+                logger.info(f"Fetched {len(attraction_images)} images for attractions")
+            for image in attraction_images:
+                cached_images[image["search_term"]] = image
+
+        itinerary["images"] = [
+            cached_images[term] for term in image_search_terms if term in cached_images
+        ]
 
         return itinerary
 
@@ -0,0 +1,11 @@
+import os
+
+# Settings requires these at import time, so provide placeholders for tests
+for key in [
+    "GEMINI_API_KEY",
+    "JWT_SECRET",
+    "UNSPLASH_ACCESS_KEY",
+    "UNSPLASH_SECRET_KEY",
+    "FLIGHT_API_KEY",
+]:
+    os.environ.setdefault(key, "test")
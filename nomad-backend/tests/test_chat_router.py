@@ -0,0 +1,88 @@
+import pytest
+from pydantic import ValidationError
+from app.services.chat_router import ChatRouter, RoutingConfig, get_routing_config
+from app.services.chat_search import ChatSearchService
+
+HISTORY = [
+    {"role": "User", "content": "Plan a week in Japan"},
+    {"role": "Nomad", "content": "Here is your itinerary..."},
+]
+
+
+@pytest.fixture
+def router():
+    return ChatRouter(get_routing_config())
+
+
+@pytest.mark.parametrize(
+    "query, history",
+    [
+        ("thanks", HISTORY),
+        ("Thank you!", []),
+        ("what currency do they use?", HISTORY),
+        ("ok", []),
+        ("what day is the market open?", []),
+    ],
+)
+def test_simple_turns_use_fast_model(router, query, history):
+    assert router.route(query, history) == ("fast", "gemini-1.5-flash")
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "Compare Rome and Florence for a honeymoon",
+        "Help me plan a trip",
+        "What are the best things to do in Kyoto in spring?",
+        "Can you recommend a hotel near the Colosseum?",
+        "Build me a 5-day itinerary for Lisbon",
+        "We have two weeks in Peru",
+        "I'm planning a honeymoon",
+        "Can you put together a 4 days loop in Sicily",
+        "Which is better, scheduled tours or going solo?",
+    ],
+)
+def test_planning_questions_use_complex_model(router, query):
+    assert router.route(query, []) == ("complex", "gemini-1.5-pro")
+
+
+@pytest.mark.parametrize(
+    "text, hits",
+    [
+        ("two weeks, 5 days", 2),
+        ("we compared tours and scheduled transfers", 2),
+        ("comparing schedules", 2),
+        ("this is a planet", 0),
+        ("what day is the market open", 0),
+    ],
+)
+def test_keywords_match_inflections(router, text, hits):
+    assert router.features(text, [])["complex_hits"] == hits
+
+
+def test_simple_keywords_match_whole_words(router):
+    assert router.features("this history", [])["simple_hits"] == 0
+
+
+def test_config_is_pluggable():
+    config = RoutingConfig(
+        fast_model="fast-model",
+        complex_model="slow-model",
+        complex_keywords=["plan"],
+        threshold=0.9,
+    )
+    assert ChatRouter(config).route("Help me plan a trip", []) == (
+        "fast",
+        "fast-model",
+    )
+
+
+def test_config_rejects_unknown_fields():
+    with pytest.raises(ValidationError):
+        RoutingConfig(keywrod_weight=0.2)
+
+
+def test_chat_service_builds_default_router_outside_di():
+    service = ChatSearchService()
+    assert isinstance(service.router.config, RoutingConfig)
+    assert service.router.route("thanks", []) == ("fast", "gemini-1.5-flash")
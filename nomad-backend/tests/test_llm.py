@@ -0,0 +1,122 @@
+import asyncio
+import pytest
+from app.core.config import settings
+from app.services import llm
+from app.services.llm import HedgedModel, get_hedge_metrics
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """Async stand-in for genai.GenerativeModel driven by behaviour[model_name]"""
+
+    behaviour = {}
+    cancelled = []
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    async def generate_content_async(self, prompt):
+        delay, result = self.behaviour[self.model_name]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(self.model_name)
+            raise
+        if isinstance(result, Exception):
+            raise result
+        return FakeResponse(result)
+
+
+@pytest.fixture(autouse=True)
+def fake_genai(monkeypatch):
+    monkeypatch.setattr(llm.genai, "configure", lambda **kwargs: None)
+    monkeypatch.setattr(llm.genai, "GenerativeModel", FakeModel)
+    monkeypatch.setattr(settings, "LLM_TIMEOUTS", {"test": 0.5})
+    monkeypatch.setattr(settings, "LLM_HEDGE_DELAYS", {"test": 0.05})
+    monkeypatch.setattr(settings, "LLM_FALLBACK_MODELS", {"test": "backup"})
+    monkeypatch.setattr(settings, "LLM_HEDGE_MIN_SAMPLES", 20)
+    monkeypatch.setattr(llm, "_stats", {})
+    FakeModel.behaviour = {}
+    FakeModel.cancelled = []
+
+
+def hedged_model():
+    return HedgedModel("test", "primary")
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_does_not_hedge():
+    FakeModel.behaviour = {"primary": (0.01, "primary"), "backup": (0.01, "backup")}
+    assert await hedged_model().generate_content("prompt") == "primary"
+    metrics = get_hedge_metrics()["test"]
+    assert metrics["hedged_on_latency"] == 0
+    assert metrics["retried_on_failure"] == 0
+
+
+@pytest.mark.asyncio
+async def test_backup_wins_and_primary_is_cancelled():
+    FakeModel.behaviour = {"primary": (0.3, "primary"), "backup": (0.01, "backup")}
+    assert await hedged_model().generate_content("prompt") == "backup"
+    await asyncio.sleep(0)
+    assert FakeModel.cancelled == ["primary"]
+    metrics = get_hedge_metrics()["test"]
+    assert metrics["hedged_on_latency"] == 1
+    assert metrics["hedge_wins"] == 1
+    assert metrics["fallback_model"] == "backup"
+
+
+@pytest.mark.asyncio
+async def test_primary_error_triggers_fallback():
+    FakeModel.behaviour = {
+        "primary": (0.0, RuntimeError("boom")),
+        "backup": (0.01, "backup"),
+    }
+    assert await hedged_model().generate_content("prompt") == "backup"
+    metrics = get_hedge_metrics()["test"]
+    assert metrics["retried_on_failure"] == 1
+    assert metrics["retry_wins"] == 1
+    assert metrics["hedged_on_latency"] == 0
+
+
+@pytest.mark.asyncio
+async def test_both_invalid_raises():
+    FakeModel.behaviour = {"primary": (0.0, "bad"), "backup": (0.01, "bad")}
+
+    def validate(text):
+        raise ValueError(f"invalid: {text}")
+
+    with pytest.raises(ValueError, match="invalid"):
+        await hedged_model().generate_content("prompt", validate=validate)
+    assert get_hedge_metrics()["test"]["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_both_requests():
+    FakeModel.behaviour = {"primary": (5, "primary"), "backup": (5, "backup")}
+    with pytest.raises(asyncio.TimeoutError):
+        await hedged_model().generate_content("prompt")
+    await asyncio.sleep(0)
+    assert sorted(FakeModel.cancelled) == ["backup", "primary"]
+    assert get_hedge_metrics()["test"]["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_primary_latency_is_recorded():
+    FakeModel.behaviour = {"primary": (0.3, "primary"), "backup": (0.01, "backup")}
+    model = hedged_model()
+    await model.generate_content("prompt")
+    await asyncio.sleep(0)
+    assert len(model.stats.latencies) == 1
+    assert model.stats.latencies[0] >= 0.05
+
+
+def test_hedge_delay_is_capped_by_timeout(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_HEDGE_MIN_SAMPLES", 1)
+    stats = llm.get_hedge_stats("test")
+    for _ in range(5):
+        stats.record_latency(0.5)
+    assert stats.hedge_delay() == 0.5 * settings.LLM_HEDGE_MAX_DELAY_FRACTION
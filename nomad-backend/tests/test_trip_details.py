@@ -0,0 +1,52 @@
+import pytest
+from app.services.trip_details import TripDetailsService
+
+ITINERARY = {
+    "summary": "A week in Lisbon",
+    "daily_itinerary": [
+        {"day": "Day 1", "activities": ["Alfama"], "meals": [], "transportation": []},
+        {"day": "Day 2", "activities": ["Belem"], "meals": [], "transportation": []},
+    ],
+    "accommodations": ["Hotel A"],
+    "tips": ["Wear comfy shoes"],
+}
+
+
+def test_merge_replaces_requested_day_with_labelled_days():
+    update = {"daily_itinerary": [{"day": "Day 2", "activities": ["Sintra"]}]}
+    merged = TripDetailsService._merge_itinerary(
+        ITINERARY, update, ["daily_itinerary"], [2]
+    )
+    assert merged["daily_itinerary"][0] == ITINERARY["daily_itinerary"][0]
+    assert merged["daily_itinerary"][1]["activities"] == ["Sintra"]
+    assert len(merged["daily_itinerary"]) == 2
+
+
+def test_merge_matches_numeric_and_labelled_days():
+    update = {"daily_itinerary": [{"day": 1, "activities": ["Cascais"]}]}
+    merged = TripDetailsService._merge_itinerary(
+        ITINERARY, update, ["daily_itinerary"], [1]
+    )
+    assert merged["daily_itinerary"][0]["activities"] == ["Cascais"]
+
+
+def test_merge_replaces_sections():
+    merged = TripDetailsService._merge_itinerary(
+        ITINERARY, {"tips": ["Buy a Viva Viagem card"]}, ["tips"]
+    )
+    assert merged["tips"] == ["Buy a Viva Viagem card"]
+    assert merged["accommodations"] == ITINERARY["accommodations"]
+
+
+def test_merge_rejects_missing_days():
+    update = {"daily_itinerary": [{"day": "Day 3", "activities": []}]}
+    with pytest.raises(ValueError, match="missing days: 2"):
+        TripDetailsService._merge_itinerary(ITINERARY, update, ["daily_itinerary"], [2])
+
+
+@pytest.mark.parametrize(
+    "targets", [["tips"], ["accommodations"], ["summary"], ["daily_itinerary"]]
+)
+def test_merge_rejects_missing_sections(targets):
+    with pytest.raises(ValueError, match="missing sections"):
+        TripDetailsService._merge_itinerary(ITINERARY, {}, targets)